@@ -1,30 +1,83 @@
 from pathlib import Path
+from types import MappingProxyType
 
 DATA_DIR = Path(__file__).parent.resolve() / "data"
 ROOT_DIR = Path(__file__).parent.parent.parent.resolve()
 
-DEFAULT_EXPORT_KWARGS = {
-    "format_type": "df",
-    "df_kwargs": {
-        "index_col": False,
-        "dtype": str,
-        "na_filter": False,
-    },
-}
+# Exports are requested as raw CSV text and parsed by REDCapFacade so
+# that every column is read as a non-nullable string.
+DEFAULT_EXPORT_KWARGS = MappingProxyType({
+    "format_type": "csv",
+})
 
-DF_NAMES = [
+DF_NAMES = (
     "project_info",
     "form_mapping",
     "field_names",
     "metadata",
     "study_data",
-]
+)
 
-METADATA_COLS = [
+DF_NAMES_SET = frozenset(DF_NAMES)
+
+METADATA_COLS = (
     "field_name",
     "form_name",
     "field_type",
     "field_label",
     "select_choices_or_calculations",
     "branching_logic",
-]
+)
+
+# Columns to keep for each dataframe; projected at read time so the
+# remaining columns are never parsed. Dataframes not listed keep all
+# columns.
+DF_COLUMN_NAMES = MappingProxyType({
+    "metadata": METADATA_COLS,
+})
+
+REDCAP_EXPORT_CONFIG = MappingProxyType({
+    "project_info": MappingProxyType({
+        "export_method": "export_project_info",
+        "export_kwargs": DEFAULT_EXPORT_KWARGS,
+    }),
+    "form_mapping": MappingProxyType({
+        "export_method": "export_instrument_event_mappings",
+        "export_kwargs": DEFAULT_EXPORT_KWARGS,
+    }),
+    "field_names": MappingProxyType({
+        "export_method": "export_field_names",
+        "export_kwargs": DEFAULT_EXPORT_KWARGS,
+    }),
+    "metadata": MappingProxyType({
+        "export_method": "export_metadata",
+        "export_kwargs": DEFAULT_EXPORT_KWARGS,
+    }),
+    "study_data": MappingProxyType({
+        "export_method": "export_records",
+        "export_kwargs": MappingProxyType({
+            **DEFAULT_EXPORT_KWARGS,
+            "export_data_access_groups": True,
+        }),
+    }),
+})
+
+# Batched study data exports first fetch every record ID in an extra
+# request, so they are only worth enabling for large studies.
+BATCH_STUDY_DATA_EXPORT = False
+
+# Number of record IDs requested per export_records call when batching
+# study data exports; batches are fetched concurrently and concatenated.
+STUDY_DATA_BATCH_SIZE = 5000
+
+# Upper bound on concurrent batch requests made to the REDCap server.
+MAX_EXPORT_WORKERS = 4
+
+# Low-cardinality columns stored as categoricals once loaded. Columns
+# absent from a given project's export (e.g. non-longitudinal projects
+# have no redcap_event_name) are skipped.
+CATEGORICAL_COLS = MappingProxyType({
+    "form_mapping": ("arm_num", "unique_event_name", "form"),
+    "metadata": ("form_name", "field_type"),
+    "study_data": ("redcap_event_name", "redcap_data_access_group"),
+})
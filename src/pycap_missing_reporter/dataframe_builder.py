@@ -1,10 +1,15 @@
+import re
+from collections import defaultdict
 from typing import ClassVar
 
 from pandas import DataFrame
 
-from pycap_missing_reporter.config import METADATA_COLS
 from pycap_missing_reporter.redcap_facade import REDCapFacade
 
+# Matches the code in each "CODE, Label" entry of REDCap's
+# "CODE, Label | CODE, Label" missing data codes string.
+MISSING_DATA_CODE_PATT = re.compile(r"(?:^|\|)\s*([^,|]+?)\s*,")
+
 
 class DataFrameBuilder:
     _instances: ClassVar[dict[REDCapFacade, "DataFrameBuilder"]] = {}
@@ -18,7 +23,9 @@ class DataFrameBuilder:
     def __init__(self, redcap_facade: REDCapFacade) -> None:
         if not hasattr(self, "_initialized"):
             self._raw_data = redcap_facade.get_dataframes("all")
-            self._helper_structs: dict[str, dict | list | DataFrame] = {}
+            self._helper_structs: dict[
+                str, dict | list | frozenset | DataFrame,
+            ] = {}
             self._initialized = True
 
     @classmethod
@@ -28,19 +35,22 @@ class DataFrameBuilder:
         return cls._instances[redcap_facade]
 
     def _make_helper_structs(self) -> None:
-        self._make_missing_data_codes_list()
+        if self._helper_structs:
+            return
+        self._make_missing_data_codes_set()
         self._make_checkbox_fields_list()
-        self._make_checkbox_fields_dict()
-        self._make_field_names_dict()
-
-    def _make_missing_data_codes_list(self) -> None:
-        code_list = [
-            code.split(",")[0]
-            for code in self._raw_data["project_info"]
-            .loc[:, "missing_data_codes"][0]
-            .split(" | ")
-        ]
-        self._helper_structs["missing_data_codes"] = code_list
+        self._make_field_names_structs()
+
+    def _make_missing_data_codes_set(self) -> None:
+        # Stored as a frozenset since it is only used for membership tests.
+        # Projects without missing data codes export an empty string, which
+        # must not become an "" code.
+        code_set = frozenset(
+            MISSING_DATA_CODE_PATT.findall(
+                self._raw_data["project_info"].loc[:, "missing_data_codes"][0],
+            ),
+        )
+        self._helper_structs["missing_data_codes"] = code_set
 
     def _make_checkbox_fields_list(self) -> None:
         dff = self._raw_data["metadata"]
@@ -49,44 +59,37 @@ class DataFrameBuilder:
             "field_name",
         ].tolist()
 
-    def _make_checkbox_fields_dict(self) -> None:
+    def _make_field_names_structs(self) -> None:
+        # checkbox_fields_dict and field_names_dict are both built from
+        # field_names, so they are filled in a single pass over its rows.
+        # Exports are read with strings_can_be_null=False, so fields without
+        # choices have an empty choice_value ("") rather than a null.
         dff = self._raw_data["field_names"]
-        self._helper_structs["checkbox_fields_dict"] = (
-            dff.loc[
-                dff["original_field_name"].isin(
-                    self._helper_structs["checkbox_fields_list"],
+        checkbox_fields = frozenset(
+            self._helper_structs["checkbox_fields_list"],
+        )
+        checkbox_fields_dict = defaultdict(list)
+        field_names_dict = {}
+        for field_name, choice_value, export_field_name in zip(
+            dff["original_field_name"],
+            dff["choice_value"],
+            dff["export_field_name"],
+            strict=True,
+        ):
+            if field_name in checkbox_fields:
+                checkbox_fields_dict[field_name].append(export_field_name)
+            if choice_value:
+                field_names_dict[f"{field_name}({choice_value})"] = (
+                    export_field_name
                 )
-            ]
-            .groupby("original_field_name")["export_field_name"]
-            .apply(list)
-            .to_dict()
+        self._helper_structs["checkbox_fields_dict"] = dict(
+            checkbox_fields_dict,
         )
-
-    def _make_field_names_dict(self) -> None:
-        dff = self._raw_data["field_names"]
-        dff.loc[dff["choice_value"].notna(), "logic_str_field_name"] = (
-            dff["original_field_name"]
-            + "("
-            + dff["choice_value"]
-            + ")"
-            )
-        self._helper_structs["field_names_dict"] = (
-            dff[dff["logic_str_field_name"].notna()]
-            .set_index("logic_str_field_name")["export_field_name"]
-            .to_dict()
-         )
-
+        self._helper_structs["field_names_dict"] = field_names_dict
 
     def _clean_dataframes(self) -> None:
-        self._clean_metadata()
         self._clean_study_data()
 
-    def _clean_metadata(self) -> None:
-        self._raw_data["metadata"] = self._raw_data["metadata"].loc[
-            :,
-            METADATA_COLS,
-        ]
-
     def _clean_study_data(self) -> None:
         raise NotImplementedError
 
@@ -1,16 +1,23 @@
+from functools import cache
+
 from lark import Lark, Transformer
 
+from pycap_missing_reporter.config import DATA_DIR
+
+# Pass-through rules are marked "?" so Lark inlines them into their parent.
 REDCAP_LOGIC_GRAMMAR = r"""
-    start: logic_str
+    ?start: logic_str
+
+    ?logic_str: and_str
+        | logic_str OR and_str -> or_operation
 
-    logic_str: term
-        | logic_str AND term -> and_operation
-        | logic_str OR term -> or_operation
+    ?and_str: term
+        | and_str AND term -> and_operation
 
-    term: comparison
+    ?term: comparison
         | "(" logic_str ")"
 
-    comparison: categorical_comparison
+    ?comparison: categorical_comparison
         | numeric_comparison
 
     categorical_comparison: field_name "=" categorical_value -> eq
@@ -24,11 +31,11 @@ REDCAP_LOGIC_GRAMMAR = r"""
                       | field_name ">=" numeric_value -> ge
                       | field_name "<=" numeric_value -> le
 
-    field_name: "[" CNAME "]"
+    ?field_name: "[" CNAME "]"
 
     categorical_value: "'" (CNAME | SIGNED_NUMBER) "'"
 
-    numeric_value: SIGNED_NUMBER
+    ?numeric_value: SIGNED_NUMBER
                   | ESCAPED_STRING
 
     AND: "AND"i
@@ -44,10 +51,10 @@ REDCAP_LOGIC_GRAMMAR = r"""
 
 class LogicTransformer(Transformer):
     def or_operation(self, args):
-        return f"({args[0]}) or ({args[1]})"
+        return f"({args[0]}) or ({args[2]})"
 
     def and_operation(self, args):
-        return f"({args[0]}) and ({args[1]})"
+        return f"({args[0]}) and ({args[2]})"
 
     def eq(self, args):
         return f"{args[0]} == {args[1]}"
@@ -67,23 +74,27 @@ class LogicTransformer(Transformer):
     def le(self, args):
         return f"{args[0]} <= {args[1]}"
 
-    def field_name(self, args):
-        return args[0]
-
     def categorical_value(self, args):
         return f"'{args[0]}'"
 
-    def numeric_value(self, args):
-        return args[0]
-
-    def start(self, args):
-        return args[0]
-
 
 redcap_logic_parser = Lark(
-    REDCAP_LOGIC_GRAMMAR, parser="lalr", transformer=LogicTransformer()
+    REDCAP_LOGIC_GRAMMAR,
+    parser="lalr",
+    transformer=LogicTransformer(),
+    # Reuses the analysed LALR tables across runs.
+    cache=str(DATA_DIR / ".lark_cache.tmp"),
 )
 
-logic_str = "[num_pushups] >= 90 and [frailty_score] = '1' or [num_pushups] <= 18 and [frailty_score] = '2'"
-transformed_logic_str = redcap_logic_parser.parse(logic_str)
-print(transformed_logic_str)
+
+# Many fields share the same branching logic, so each distinct logic
+# string is parsed once and the translated expression reused.
+@cache
+def translate_logic_str(logic_str: str) -> str:
+    return redcap_logic_parser.parse(logic_str)
+
+
+if __name__ == "__main__":
+    logic_str = "[num_pushups] >= 90 and [frailty_score] = '1' or [num_pushups] <= 18 and [frailty_score] = '2'"
+    transformed_logic_str = translate_logic_str(logic_str)
+    print(transformed_logic_str)
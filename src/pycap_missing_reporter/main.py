@@ -1,6 +1,5 @@
 import argparse
 import os
-from distutils.util import strtobool
 
 from dotenv import load_dotenv
 
@@ -9,6 +8,11 @@ from pycap_missing_reporter.dataframe_builder import DataFrameBuilder
 from pycap_missing_reporter.redcap_facade import REDCapFacade
 
 
+def _as_bool(value: str | None) -> bool:
+    return isinstance(value, str) and value.strip().lower() in (
+        "1", "true", "yes", "y", "on",
+    )
+
 def _load_env_vars(dev: bool | None = False) -> None:
     if dev:
         load_dotenv(ROOT_DIR / ".dev.env")
@@ -55,18 +59,8 @@ def main() -> None:
 
     _load_env_vars(args.dev)
 
-    cache_results = os.getenv("CACHE_INTERMEDIATE_VALUES")
-    use_cache = os.getenv("USE_CACHED_VALUES")
-
-    if not isinstance(cache_results, str):
-        cache_results = False
-    else:
-        cache_results = bool(strtobool(cache_results))
-
-    if not isinstance(use_cache, str):
-        use_cache = False
-    else:
-        use_cache = bool(strtobool(use_cache))
+    cache_results = _as_bool(os.getenv("CACHE_INTERMEDIATE_VALUES"))
+    use_cache = _as_bool(os.getenv("USE_CACHED_VALUES"))
 
     api_key = args.api_key
     api_url = args.api_url
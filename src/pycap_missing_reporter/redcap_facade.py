@@ -1,14 +1,28 @@
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO, StringIO
+from os import stat_result
 from pathlib import Path
 from typing import ClassVar
 
 import pandas as pd
+import pyarrow as pa
 from pandas import DataFrame
+from pyarrow import csv as pacsv
 from redcap.project import Project
 
 from pycap_missing_reporter.config import (
+    BATCH_STUDY_DATA_EXPORT,
+    CATEGORICAL_COLS,
     DATA_DIR,
-    DEFAULT_EXPORT_KWARGS,
+    DF_COLUMN_NAMES,
     DF_NAMES,
+    DF_NAMES_SET,
+    MAX_EXPORT_WORKERS,
+    REDCAP_EXPORT_CONFIG,
+    STUDY_DATA_BATCH_SIZE,
 )
 
 
@@ -25,6 +39,7 @@ class REDCapFacade:
     def __init__(self, api_url: str, api_key: str) -> None:
         if not hasattr(self, "_initialized"):
             self._dataframes: dict[str, DataFrame] = {}
+            self._project: Project | None = None
             self._api_url = api_url
             self._api_key = api_key
             self._initialized = True
@@ -48,7 +63,19 @@ class REDCapFacade:
         if isinstance(names, str):
             if names.lower() == "all":
                 return self._dataframes
-            return {names: self._dataframes[names]}
+            names = [names]
+
+        if not all(isinstance(name, str) for name in names):
+            error_str = "Error: Dataframe names must be strings."
+            raise TypeError(error_str)
+
+        unknown_names = set(names) - DF_NAMES_SET
+        if unknown_names:
+            error_str = (
+                f"Error: Unknown dataframe names: {sorted(unknown_names)}."
+            )
+            raise ValueError(error_str)
+
         return {name: self._dataframes[name] for name in names}
 
     def load_dataframes(self, cache_opt: str = "redcap") -> None:
@@ -58,45 +85,204 @@ class REDCapFacade:
             self._get_dataframes_from_cache()
         if cache_opt == "redcap":
             self._get_dataframes_from_redcap()
+        self._convert_categorical_cols()
 
-    def _get_dataframes_from_redcap(self) -> None:
-        project = Project(self._api_url, self._api_key)
-        self._dataframes["project_info"] = project.export_project_info(
-            **DEFAULT_EXPORT_KWARGS,
-        )
-        self._dataframes["form_mapping"] = (
-            project.export_instrument_event_mappings(
-                **DEFAULT_EXPORT_KWARGS,
+    def _convert_categorical_cols(self) -> None:
+        for name, cols in CATEGORICAL_COLS.items():
+            if name not in self._dataframes:
+                continue
+            df = self._dataframes[name]
+            self._dataframes[name] = df.astype(
+                {col: "category" for col in cols if col in df.columns},
             )
+
+    def _get_project(self) -> Project:
+        # Project fetches metadata such as def_field lazily and caches it on
+        # the instance, so one instance is kept per facade to reuse it.
+        if self._project is None:
+            self._project = Project(self._api_url, self._api_key)
+        return self._project
+
+    def _get_dataframes_from_redcap(self) -> None:
+        project = self._get_project()
+        # Each export is an independent, network-bound request, so they are
+        # issued concurrently rather than one round-trip at a time.
+        with ThreadPoolExecutor(max_workers=len(DF_NAMES)) as executor:
+            futures = {
+                name: executor.submit(self._export_dataframe, project, name)
+                for name in DF_NAMES
+            }
+
+        for name, future in futures.items():
+            self._dataframes[name] = future.result()
+
+    @classmethod
+    def _export_dataframe(cls, project: Project, name: str) -> DataFrame:
+        if name == "study_data":
+            return cls._export_study_data(project)
+        export_config = REDCAP_EXPORT_CONFIG[name]
+        csv_text = getattr(project, export_config["export_method"])(
+            **export_config["export_kwargs"],
         )
-        self._dataframes["field_names"] = project.export_field_names(
-            **DEFAULT_EXPORT_KWARGS,
-        )
-        self._dataframes["metadata"] = project.export_metadata(
-            **DEFAULT_EXPORT_KWARGS,
-        )
-        export_study_data_kwargs = DEFAULT_EXPORT_KWARGS.copy()
-        export_study_data_kwargs.update({"export_data_access_groups": True})
-        self._dataframes["study_data"] = project.export_records(
-            **export_study_data_kwargs,
-        )
+        return cls._parse_csv_text(csv_text, DF_COLUMN_NAMES.get(name))
+
+    @classmethod
+    def _export_study_data(cls, project: Project) -> DataFrame:
+        export_config = REDCAP_EXPORT_CONFIG["study_data"]
+        export_method = getattr(project, export_config["export_method"])
+        export_kwargs = export_config["export_kwargs"]
+        # Batching needs every record ID up front, which costs an extra
+        # request, so by default study data is exported in a single call.
+        record_ids = []
+        if BATCH_STUDY_DATA_EXPORT:
+            record_ids = list(dict.fromkeys(
+                record[project.def_field]
+                for record in export_method(
+                    fields=[project.def_field],
+                    format_type="json",
+                )
+            ))
+
+        if len(record_ids) <= STUDY_DATA_BATCH_SIZE:
+            return cls._parse_csv_text(export_method(**export_kwargs))
+
+        # Large studies are fetched in record-ID batches so no single
+        # response holds the whole study, and batches overlap on the wire.
+        batches = [
+            record_ids[i:i + STUDY_DATA_BATCH_SIZE]
+            for i in range(0, len(record_ids), STUDY_DATA_BATCH_SIZE)
+        ]
+        max_workers = min(len(batches), MAX_EXPORT_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(
+                lambda batch: cls._parse_csv_text(
+                    export_method(records=batch, **export_kwargs),
+                ),
+                batches,
+            ))
+
+        return pd.concat(frames, ignore_index=True)
 
     def _get_dataframes_from_cache(
         self, cache_dir: Path = _EXPORT_DIR,
     ) -> None:
-        for name in DF_NAMES:
-            cache_file = cache_dir / f"{name}.csv"
-            if cache_file.exists():
-                self._dataframes[name] = pd.read_csv(
+        # One directory scan validates every cache file at once; the
+        # entries' stat results (cached per entry) key _parse_cache_file.
+        with os.scandir(cache_dir) as dir_entries:
+            cache_entries = {
+                entry.name: entry for entry in dir_entries if entry.is_file()
+            }
+
+        missing_files = [
+            f"{name}.csv"
+            for name in DF_NAMES
+            if f"{name}.csv" not in cache_entries
+        ]
+        if missing_files:
+            error_str = (
+                f"Error: Missing cached files in {cache_dir}: {missing_files}."
+            )
+            raise FileNotFoundError(error_str)
+
+        cache_files = {name: cache_dir / f"{name}.csv" for name in DF_NAMES}
+        cache_stats = {
+            name: cache_entries[f"{name}.csv"].stat() for name in DF_NAMES
+        }
+
+        # Reads are I/O bound and the C parser releases the GIL, so the
+        # cached CSVs can be loaded concurrently.
+        with ThreadPoolExecutor(max_workers=len(cache_files)) as executor:
+            futures = {
+                name: executor.submit(
+                    self._read_cache_file,
                     cache_file,
-                    **DEFAULT_EXPORT_KWARGS["df_kwargs"],
+                    cache_stats[name],
+                    DF_COLUMN_NAMES.get(name),
                 )
+                for name, cache_file in cache_files.items()
+            }
 
-        if len(self._dataframes) != len(DF_NAMES):
-            raise FileNotFoundError
+        for name, future in futures.items():
+            self._dataframes[name] = future.result()
+
+    @classmethod
+    def _read_cache_file(
+        cls,
+        cache_file: Path,
+        stat: stat_result,
+        columns: tuple[str, ...] | None = None,
+    ) -> DataFrame:
+        # The cache key includes the file's mtime and size so that a
+        # rewritten cache file misses the cache instead of returning stale
+        # data. Callers get a shallow copy so adding columns to the
+        # returned frame does not leak into the cached one.
+        return cls._parse_cache_file(
+            cache_file,
+            stat.st_mtime_ns,
+            stat.st_size,
+            columns,
+        ).copy(deep=False)
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _parse_cache_file(
+        cls,
+        cache_file: Path,
+        mtime_ns: int,  # NOQA: ARG003
+        size: int,
+        columns: tuple[str, ...] | None,
+    ) -> DataFrame:
+        # Empty exports are saved as 0-byte files, which have no header.
+        if size == 0:
+            return DataFrame()
+        if columns is None:
+            with cache_file.open(newline="") as csv_file:
+                columns = tuple(next(csv.reader(csv_file)))
+        # Memory-mapping lets large cache files (study_data) be paged in on
+        # demand rather than copied through buffered reads. Parsing copies
+        # values into new Arrow buffers, so the map can be closed after.
+        with pa.memory_map(str(cache_file), "r") as mapped_file:
+            return cls._parse_csv(mapped_file, columns)
+
+    @classmethod
+    def _parse_csv_text(
+        cls, csv_text: str, columns: tuple[str, ...] | None = None,
+    ) -> DataFrame:
+        # REDCap returns an empty body for empty exports.
+        if not csv_text.strip():
+            return DataFrame()
+        if columns is None:
+            columns = tuple(next(csv.reader(StringIO(csv_text))))
+        return cls._parse_csv(BytesIO(csv_text.encode()), columns)
+
+    @staticmethod
+    def _parse_csv(
+        csv_file: BytesIO | pa.NativeFile, columns: tuple[str, ...],
+    ) -> DataFrame:
+        # Every column is typed as a non-nullable string up front, so values
+        # are kept verbatim without pyarrow inferring, and then re-casting,
+        # column types. Notes fields and field labels can hold quoted
+        # newlines, which the block reader only handles when told to.
+        table = pacsv.read_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in columns},
+                include_columns=columns,
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+        # ArrowDtype columns wrap the parsed Arrow buffers without copying
+        # them into Python str objects.
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
 
     def save_dataframes_to_csv(self, export_dir: Path = _EXPORT_DIR) -> None:
         self.load_dataframes()
         Path.mkdir(export_dir, parents=True, exist_ok=True)
         for name, df in self._dataframes.items():
-            df.to_csv(export_dir / f"{name}.csv", index=False)
+            pacsv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                export_dir / f"{name}.csv",
+            )
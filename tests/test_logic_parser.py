@@ -1,6 +1,9 @@
 import random
 
 import pandas as pd
+import pytest
+
+from pycap_missing_reporter.logic_parser import translate_logic_str
 
 categorical_eq = "[frailty_score] = '1'"
 numeric_eq = "[num_pushups] = 25"
@@ -42,3 +45,27 @@ def generate_df(num_records):
 
     return df
 
+
+@pytest.mark.parametrize(
+    ("logic_str", "expected"),
+    [
+        (categorical_eq, "frailty_score == '1'"),
+        (numeric_eq, "num_pushups == 25"),
+        (categorical_neq, "frailty_score != '2'"),
+        (numeric_neq, "num_pushups != 30"),
+        (parentheses_eq, "num_pushups == 25"),
+        (and_eq, "(num_pushups == 25) and (frailty_score == '4')"),
+        (or_eq, "(num_pushups == 25) or (frailty_score == '5')"),
+        (or_gt_lt, "(num_pushups > 75) or (num_pushups < 30)"),
+        (and_gte_lte, "(num_pushups >= 25) and (num_pushups <= 30)"),
+        (
+            combined_logical_operators,
+            (
+                "((num_pushups >= 90) and (frailty_score == '1'))"
+                " or ((num_pushups <= 18) and (frailty_score == '2'))"
+            ),
+        ),
+    ],
+)
+def test_translate_logic_str(logic_str, expected):
+    assert translate_logic_str(logic_str) == expected
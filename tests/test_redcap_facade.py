@@ -0,0 +1,44 @@
+from pycap_missing_reporter.redcap_facade import REDCapFacade
+
+num_rows = 50_000
+multiline_note = "First line of the note.\nSecond line, with a comma.\n" * 5
+
+
+def write_multiline_csv(csv_path):
+    with csv_path.open("w", newline="") as csv_file:
+        csv_file.write("record_id,notes,age\n")
+        for i in range(num_rows):
+            csv_file.write(f'{i:06},"{multiline_note}",{i % 90}\n')
+
+
+def test_read_cache_file_multiline_values(tmp_path):
+    csv_path = tmp_path / "study_data.csv"
+    write_multiline_csv(csv_path)
+    # Larger than pyarrow's default 1 MB block, so values with newlines
+    # straddle block boundaries.
+    assert csv_path.stat().st_size > 2**20
+
+    df = REDCapFacade._read_cache_file(csv_path, csv_path.stat())
+
+    assert df.shape == (num_rows, 3)
+    assert (df["notes"] == multiline_note).all()
+    assert df["record_id"].iloc[-1] == f"{num_rows - 1:06}"
+
+
+def test_parse_csv_text_multiline_values(tmp_path):
+    csv_path = tmp_path / "study_data.csv"
+    write_multiline_csv(csv_path)
+
+    df = REDCapFacade._parse_csv_text(csv_path.read_text())
+
+    assert df.shape == (num_rows, 3)
+    assert (df["notes"] == multiline_note).all()
+
+
+def test_read_cache_file_empty_export(tmp_path):
+    csv_path = tmp_path / "form_mapping.csv"
+    csv_path.touch()
+
+    df = REDCapFacade._read_cache_file(csv_path, csv_path.stat())
+
+    assert df.empty